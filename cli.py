@@ -20,11 +20,15 @@ Note: Keep Chrome and chromedriver reasonably up to date. If "headless" causes i
 # import rarfile
 # import shutil
 import argparse
+import hashlib
 import time
 import os
 import re
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
 from rich.panel import Panel
@@ -113,10 +117,30 @@ def setup_driver(download_dir: Path, headless: bool = True, disable_images: bool
         raise
 
 
-def scrape_links(driver: webdriver.Chrome, url: str, wait_time: int = DEFAULT_MAX_WAIT) -> List[str]:
+def quit_driver(driver: webdriver.Chrome, timeout: float = 5) -> None:
+    """Quit the browser and wait (up to timeout seconds) for chromedriver to exit.
+
+    Lets a session refresh start the next driver as soon as the old one is
+    really gone instead of sleeping a fixed amount.
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    if process is not None:
+        try:
+            process.wait(timeout)
+        except Exception:
+            pass
+
+
+def scrape_links(driver: webdriver.Chrome, url: str, wait_time: int = DEFAULT_MAX_WAIT,
+                 on_link: Optional[Callable[[str], None]] = None) -> List[str]:
     """Scrape download-page links from the main page.
 
     Tries multiple fallback selectors to collect hrefs found inside article-like containers.
+    If on_link is given it is called with each new link as soon as it is found.
     """
     links: List[str] = []
     console.print("[cyan]🌐 Opening main page...[/cyan]")
@@ -147,22 +171,18 @@ def scrape_links(driver: webdriver.Chrome, url: str, wait_time: int = DEFAULT_MA
         if not anchors:
             anchors = driver.find_elements(By.CSS_SELECTOR, "a[href]")
 
+        # Keep order unique
+        seen = set()
         for a in anchors:
             try:
                 href = a.get_attribute("href")
-                if href and href.startswith("http"):
-                    links.append(href)
             except Exception:
                 continue
-
-        # Keep order unique
-        seen = set()
-        unique = []
-        for l in links:
-            if l not in seen:
-                seen.add(l)
-                unique.append(l)
-        links = unique
+            if href and href.startswith("http") and href not in seen:
+                seen.add(href)
+                links.append(href)
+                if on_link:
+                    on_link(href)
 
         console.print(f"[green]📄 Found {len(links)} links (raw).[/green]")
 
@@ -246,20 +266,10 @@ def wait_for_download_complete(download_dir: Path, before_files: set, target_url
 
 
 
-def get_filename_from_url(url: str) -> Optional[str]:
-    """
-    Robust filename extractor:
-      1) Uses the URL path segment (last path part)
-      2) Falls back to common query params (file, filename, name, etc.)
-      3) Falls back to fragment (rare)
-      4) As last resort tries a HEAD request and parses Content-Disposition header
-    Returns: filename with extension (e.g. 'game.rar') or None if not determinable.
-    """
-    if not url:
-        return None
-
+@lru_cache(maxsize=8192)
+def _filename_from_url_parts(url: str) -> Optional[str]:
+    """Steps 1-3 of get_filename_from_url: pure parsing, no network, safe to memoize."""
     try:
-        url = url.strip()
         parsed = urlparse(url)
 
         # 1) Path-based filename (most common)
@@ -285,42 +295,191 @@ def get_filename_from_url(url: str) -> Optional[str]:
             if frag_candidate and "." in frag_candidate:
                 return frag_candidate
 
-        # 4) HEAD request -> Content-Disposition (last resort; optional)
-        try:
-            import requests
-            head = requests.head(url, allow_redirects=True, timeout=5)
-            cd = head.headers.get("content-disposition")
-            if cd:
-                # filename*=UTF-8''%e2%82%ac%20rates  or filename="name.ext"
-                m = re.search(r"filename\*\s*=\s*([^;]+)", cd, flags=re.I)
-                if m:
-                    fname = m.group(1).strip().strip("\"'")
-                    # handle RFC5987 (e.g. UTF-8''... percent-encoded)
-                    if "''" in fname:
-                        try:
-                            fname = unquote(fname.split("''", 1)[1])
-                        except Exception:
-                            pass
-                    fname = unquote(fname)
-                    if "." in fname:
-                        return fname
-
-                m2 = re.search(r'filename\s*=\s*"?(?P<name>[^\";]+)"?', cd, flags=re.I)
-                if m2:
-                    fname = m2.group("name").strip().strip("\"'")
-                    fname = unquote(fname)
-                    if "." in fname:
-                        return fname
-        except Exception:
-            # requests missing or HEAD failed — that's OK, just give up gracefully
-            pass
-
     except Exception:
         pass
 
     return None
 
 
+@lru_cache(maxsize=1024)
+def _head_filename(url: str) -> Optional[str]:
+    """Step 4 of get_filename_from_url: Content-Disposition from a HEAD request.
+
+    A failed request raises instead of returning None, and lru_cache doesn't keep
+    exceptions, so only real answers are memoized and a failure is retried later.
+    """
+    import requests
+    head = requests.head(url, allow_redirects=True, timeout=5)
+    head.raise_for_status()
+    return filename_from_content_disposition(head.headers.get("content-disposition"))
+
+
+def get_filename_from_url(url: str) -> Optional[str]:
+    """
+    Robust filename extractor:
+      1) Uses the URL path segment (last path part)
+      2) Falls back to common query params (file, filename, name, etc.)
+      3) Falls back to fragment (rare)
+      4) As last resort tries a HEAD request and parses Content-Disposition header
+    Returns: filename with extension (e.g. 'game.rar') or None if not determinable.
+    """
+    if not url:
+        return None
+
+    url = url.strip()
+    fname = _filename_from_url_parts(url)
+    if fname:
+        return fname
+
+    # 4) HEAD request -> Content-Disposition (last resort; optional)
+    try:
+        return _head_filename(url)
+    except Exception:
+        # requests missing or HEAD failed — that's OK, just give up gracefully
+        return None
+
+
+def filename_from_content_disposition(cd: Optional[str]) -> Optional[str]:
+    """Extract the filename from a Content-Disposition header value, if any."""
+    if not cd:
+        return None
+
+    # filename*=UTF-8''%e2%82%ac%20rates  or filename="name.ext"
+    m = re.search(r"filename\*\s*=\s*([^;]+)", cd, flags=re.I)
+    if m:
+        fname = m.group(1).strip().strip("\"'")
+        # handle RFC5987 (e.g. UTF-8''... percent-encoded)
+        if "''" in fname:
+            try:
+                fname = unquote(fname.split("''", 1)[1])
+            except Exception:
+                pass
+        fname = unquote(fname)
+        if "." in fname:
+            return fname
+
+    m2 = re.search(r'filename\s*=\s*"?(?P<name>[^\";]+)"?', cd, flags=re.I)
+    if m2:
+        fname = m2.group("name").strip().strip("\"'")
+        fname = unquote(fname)
+        if "." in fname:
+            return fname
+
+    return None
+
+
+_http = threading.local()
+
+
+def _http_session():
+    """One requests.Session per thread, so pooled downloads keep their connections alive."""
+    session = getattr(_http, "session", None)
+    if session is None:
+        import requests
+        session = _http.session = requests.Session()
+    return session
+
+
+def is_direct_download(url: str, timeout: int = 10) -> bool:
+    """HEAD probe: True if url serves a file directly rather than a page that needs the browser."""
+    try:
+        resp = _http_session().head(url, allow_redirects=True, timeout=timeout)
+    except Exception:
+        return False
+
+    if resp.status_code != 200:
+        return False
+    if resp.headers.get("content-disposition"):
+        return True
+    ctype = resp.headers.get("content-type", "").lower()
+    return bool(ctype) and "html" not in ctype
+
+
+def _move_no_clobber(src, dst: Path) -> None:
+    """Move src to dst, raising FileExistsError instead of replacing an existing dst."""
+    if os.name == "nt":
+        os.rename(src, dst)  # already refuses to replace on Windows
+        return
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        raise
+    except OSError:
+        # no hard links on this filesystem (FAT/exFAT drives); best effort
+        if dst.exists():
+            raise FileExistsError(dst)
+        os.rename(src, dst)
+        return
+    os.remove(src)
+
+
+def download_direct(url: str, download_dir: Path, timeout: int = DEFAULT_MAX_WAIT,
+                    chunk_size: int = 1 << 20, cancel: Optional[threading.Event] = None,
+                    staging_dir: Optional[Path] = None) -> object:
+    """Stream a direct file link to download_dir without going through the browser.
+
+    The .part file gets a unique name in staging_dir (default: download_dir), so two
+    links serving the same filename never share one, and is only moved into
+    download_dir once complete; keep staging_dir on the same filesystem.
+
+    Each chunk is fed to SHA-256 as it is written, so the file never has to be read
+    back for verification. Returns (filename, sha256_hex); "EXISTS" if download_dir
+    already has a file by the server's name; "CANCELLED" if cancel was set mid-transfer;
+    or None if the URL serves an HTML page (needs the browser) or the request fails.
+    The .part file is removed on every path that doesn't return a filename.
+    """
+    part_path = None
+    try:
+        with _http_session().get(url, stream=True, allow_redirects=True, timeout=timeout) as resp:
+            if resp.status_code != 200:
+                return None
+            if "html" in resp.headers.get("content-type", "").lower():
+                return None
+
+            filename = (filename_from_content_disposition(resp.headers.get("content-disposition"))
+                        or get_filename_from_url(resp.url)
+                        or get_filename_from_url(url))
+            if not filename:
+                return None
+            # never let a server-supplied name escape the download directory
+            filename = os.path.basename(filename.replace("\\", "/"))
+            target = download_dir / filename
+            if target.exists():
+                console.print(f"  [yellow]⏭️ Already downloaded earlier: {filename}[/yellow]")
+                return "EXISTS"
+
+            fd, part_path = tempfile.mkstemp(suffix=".part", prefix=filename + ".",
+                                             dir=staging_dir or download_dir)
+            sha256 = hashlib.sha256()
+            with os.fdopen(fd, "wb") as f:
+                for chunk in resp.iter_content(chunk_size):
+                    if cancel is not None and cancel.is_set():
+                        break
+                    f.write(chunk)
+                    sha256.update(chunk)
+
+        if cancel is not None and cancel.is_set():
+            os.remove(part_path)
+            return "CANCELLED"
+        # the name may have been taken while streaming; never overwrite it
+        try:
+            _move_no_clobber(part_path, target)
+        except FileExistsError:
+            os.remove(part_path)
+            console.print(f"  [yellow]⏭️ Already downloaded earlier: {filename}[/yellow]")
+            return "EXISTS"
+        return filename, sha256.hexdigest()
+
+    except Exception as e:
+        console.print(f"  [yellow]⚠️ Direct download failed, falling back to browser: {e}[/yellow]")
+        if part_path is not None:
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+        return None
+
+
 def check_file_exists(download_dir: Path, url: str) -> Optional[str]:
     """
     Detect if the target (completed or in-progress) file already exists.
@@ -352,24 +511,31 @@ def check_file_exists(download_dir: Path, url: str) -> Optional[str]:
         esc_base = re.escape(base)
         pattern = re.compile(rf"^{esc_base}(?:\s*\(\d+\))?{re.escape(ext)}(?:\.crdownload|\.part|\.tmp)?$", flags=re.I)
 
-        for fname in os.listdir(download_dir):
-            if pattern.match(fname):
-                return fname
-
         # As a fallback, allow base to appear anywhere in the stem (helps with slight variations)
         # but still require same extension or a known temp extension.
-        fallback_exts = [ext, ext + ".crdownload", ext + ".part", ext + ".tmp"]
-        for fname in os.listdir(download_dir):
-            lf = fname.lower()
-            for fe in fallback_exts:
-                if lf.endswith(fe.lower()):
-                    stem = lf[: -len(fe)]
-                    # remove trailing ' (1)' etc for comparison
-                    stem_clean = re.sub(r"\s*\(\d+\)$", "", stem).strip()
-                    if base.lower() in stem_clean:
-                        return fname
-
-        return None
+        fallback_exts = [fe.lower() for fe in (ext, ext + ".crdownload", ext + ".part", ext + ".tmp")]
+        base_lower = base.lower()
+        fallback = None
+
+        # Single directory pass: an exact match wins outright, otherwise the
+        # first fallback candidate seen is returned
+        with os.scandir(download_dir) as entries:
+            for entry in entries:
+                fname = entry.name
+                if pattern.match(fname):
+                    return fname
+                if fallback is None:
+                    lf = fname.lower()
+                    for fe in fallback_exts:
+                        if lf.endswith(fe):
+                            stem = lf[: -len(fe)]
+                            # remove trailing ' (1)' etc for comparison
+                            stem_clean = re.sub(r"\s*\(\d+\)$", "", stem).strip()
+                            if base_lower in stem_clean:
+                                fallback = fname
+                                break
+
+        return fallback
 
     except Exception:
         return None
@@ -490,8 +656,10 @@ URL_REGEX = re.compile(
 )
 
 def read_urls_from_txt(file_path: str) -> list[str]:
-    """Read and extract URLs from a text file, ignoring comments and markdown."""
+    """Read and extract URLs from a text file, ignoring comments and markdown.
+    Duplicates are dropped while reading; first-seen order is kept."""
     urls: list[str] = []
+    seen: set[str] = set()
 
     try:
         with open(file_path, "r", encoding="utf-8") as f:
@@ -503,8 +671,10 @@ def read_urls_from_txt(file_path: str) -> list[str]:
                     continue
 
                 # Extract URLs from the line
-                found_urls = URL_REGEX.findall(line)
-                urls.extend(found_urls)
+                for url in URL_REGEX.findall(line):
+                    if url not in seen:
+                        seen.add(url)
+                        urls.append(url)
 
         console.print(f"[cyan]📄 Loaded {len(urls)} URLs from {file_path}[/cyan]")
 
@@ -612,22 +782,14 @@ def run(args):
 
                 if downloads_since_refresh >= args.session_refresh:
                     console.print("  [yellow]🔄 Refreshing browser session...[/yellow]")
-                    try:
-                        driver.quit()
-                    except Exception:
-                        pass
-                    time.sleep(1)
+                    quit_driver(driver)
                     driver = setup_driver(download_dir, headless=args.headless, disable_images=not args.no_image_block)
                     downloads_since_refresh = 0
 
                 result = click_download_button(driver, link, download_dir, max_wait=args.max_wait)
                 if result == "SESSION_EXPIRED":
                     console.print("  [yellow]🔄 Restarting browser session (expired)...[/yellow]")
-                    try:
-                        driver.quit()
-                    except Exception:
-                        pass
-                    time.sleep(1)
+                    quit_driver(driver)
                     driver = setup_driver(download_dir, headless=args.headless, disable_images=not args.no_image_block)
                     downloads_since_refresh = 0
                     result = click_download_button(driver, link, download_dir, max_wait=args.max_wait)
@@ -0,0 +1,22 @@
+"""
+Bake app.png into icon_data.py so the GUI doesn't read it from disk at startup.
+
+Usage:
+    python make_icon_data.py [app.png]
+"""
+import base64
+import sys
+
+
+def main():
+    src = sys.argv[1] if len(sys.argv) > 1 else 'app.png'
+    with open(src, 'rb') as f:
+        data = base64.b64encode(f.read())
+    with open('icon_data.py', 'w', encoding='ascii') as f:
+        f.write('# Generated by make_icon_data.py from %s - do not edit.\n' % src)
+        f.write('ICON_B64 = %r\n' % data)
+    print(f"Wrote icon_data.py ({len(data)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,22 +17,23 @@ To create executable:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-from tkinter.font import Font
 import threading
 import queue
+import concurrent.futures
+from collections import Counter
 import os
+import sys
 import time
 import hashlib
 import json
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, List
 import webbrowser
 
 # Import your existing selenium downloader functions
 from cli import (
     setup_driver, scrape_links, click_download_button, 
-    check_file_exists, get_filename_from_url, read_urls_from_txt
+    check_file_exists, get_filename_from_url, read_urls_from_txt, quit_driver
 )
 
 
@@ -44,7 +45,40 @@ class DownloadStatus:
     SKIPPED = "skipped"
 
 
+# Checksums of finished files run on this many threads beside the download loop
+HASH_WORKERS = 2
+
+# Checksums already computed, kept beside the downloads (same file richer_gui.py uses)
+HASH_CACHE_FILE = '.repack_hashes.json'
+
+# Activity log is trimmed by LOG_TRIM_LINES once it grows past LOG_MAX_LINES
+LOG_MAX_LINES = 2000
+LOG_TRIM_LINES = 500
+
+# Built once at import; queue_row_values looks up every row here
+_STATUS_ICON = {
+    DownloadStatus.PENDING: '⏳',
+    DownloadStatus.DOWNLOADING: '⬇️',
+    DownloadStatus.COMPLETED: '✅',
+    DownloadStatus.FAILED: '❌',
+    DownloadStatus.SKIPPED: '⏭️'
+}
+
+_STATS_ROWS = (
+    ('total', "Total Files:"),
+    ('completed', "✅ Completed:"),
+    ('pending', "⏳ Pending:"),
+    ('downloading', "⬇️ Downloading:"),
+    ('skipped', "⏭️ Skipped:"),
+    ('failed', "❌ Failed:"),
+    ('rate', "Success Rate:"),
+)
+
+
 class DownloadItem:
+    __slots__ = ('url', 'filename', 'status', 'progress', 'size', 'checksum',
+                 'error', 'start_time', 'end_time', 'iid', 'row')
+
     def __init__(self, url: str, filename: str = None):
         self.url = url
         self.filename = filename or get_filename_from_url(url) or url[:50]
@@ -55,6 +89,8 @@ class DownloadItem:
         self.error = None
         self.start_time = None
         self.end_time = None
+        self.iid = None  # its row in queue_tree
+        self.row = None  # values that row currently shows
 
 
 class DownloaderGUI:
@@ -66,12 +102,26 @@ class DownloaderGUI:
         
         # Queue for thread-safe GUI updates
         self.gui_queue = queue.Queue()
+        self._log_scroll_pending = False
+        # write_log formats the timestamp once per second, not once per call
+        self._ts_sec = 0
+        self._ts_str = ''
         
         # Download state
         self.download_items: List[DownloadItem] = []
+        # How many items sit in each status; only set_status() changes it
+        self.status_counts = Counter()
+        self._status_lock = threading.Lock()
         self.is_downloading = False
         self.driver = None
         self.download_thread = None
+        # hashlib releases the GIL, so threads are enough to hash off the download loop
+        self.hash_pool = concurrent.futures.ThreadPoolExecutor(max_workers=HASH_WORKERS)
+        self._checksum_cache = {}
+        self._hash_cache_dirty = False
+        
+        # Settings text last read or written, to skip no-op saves
+        self._last_settings_blob = None
         
         # Settings
         self.settings = {
@@ -264,8 +314,17 @@ class DownloaderGUI:
         stats_frame = ttk.LabelFrame(parent, text="📊 Statistics", padding=10)
         stats_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.stats_text = tk.Text(stats_frame, height=8, wrap=tk.WORD, font=('Consolas', 9))
-        self.stats_text.pack(fill=tk.BOTH, expand=True)
+        stats_frame.columnconfigure(1, weight=1)
+        self.stat_vars = {}
+        for row, (key, text) in enumerate(_STATS_ROWS):
+            pady = (8, 0) if key == 'rate' else 0
+            var = tk.StringVar() if key == 'rate' else tk.IntVar()
+            ttk.Label(stats_frame, text=text, font=('Consolas', 9)).grid(
+                row=row, column=0, sticky=tk.W, pady=pady)
+            ttk.Label(stats_frame, textvariable=var, font=('Consolas', 9)).grid(
+                row=row, column=1, sticky=tk.E, pady=pady)
+            self.stat_vars[key] = var
+        self._shown_stats = {}
         self.update_statistics()
         
     def setup_right_panel(self, parent):
@@ -362,44 +421,75 @@ class DownloaderGUI:
             
     def log(self, message: str, level: str = 'info'):
         """Add message to log"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.log_text.insert(tk.END, f'[{timestamp}] ', 'timestamp')
-        self.log_text.insert(tk.END, f'{message}\n', level)
+        self.write_log([(message, level)])
+        
+    def write_log(self, entries):
+        """Append (message[, level]) entries with a single insert"""
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime('[%H:%M:%S] ', time.localtime(now))
+        chunks = []
+        for message, *level in entries:
+            chunks += [self._ts_str, 'timestamp', f'{message}\n', level[0] if level else 'info']
+        self.log_text.insert(tk.END, *chunks)
+        
+        # Cap the widget at LOG_MAX_LINES, trimming a block at a time
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > LOG_MAX_LINES:
+            first_kept = line_count - LOG_MAX_LINES + LOG_TRIM_LINES
+            self.log_text.delete('1.0', f'{first_kept}.0')
+        
+        # Scroll once the GUI goes idle, not after every write
+        if not self._log_scroll_pending:
+            self._log_scroll_pending = True
+            self.root.after_idle(self.scroll_log)
+            
+    def scroll_log(self):
+        self._log_scroll_pending = False
         self.log_text.see(tk.END)
         
     def update_status(self, message: str):
         """Update status bar"""
         self.status_label.config(text=message)
         
+    def set_status(self, item: DownloadItem, status: str):
+        """Set item.status and adjust status_counts to match; safe from worker threads"""
+        with self._status_lock:
+            self.status_counts[item.status] -= 1
+            item.status = status
+            self.status_counts[status] += 1
+        
     def update_statistics(self):
         """Update statistics display"""
         total = len(self.download_items)
-        completed = sum(1 for item in self.download_items if item.status == DownloadStatus.COMPLETED)
-        failed = sum(1 for item in self.download_items if item.status == DownloadStatus.FAILED)
-        skipped = sum(1 for item in self.download_items if item.status == DownloadStatus.SKIPPED)
-        pending = sum(1 for item in self.download_items if item.status == DownloadStatus.PENDING)
-        downloading = sum(1 for item in self.download_items if item.status == DownloadStatus.DOWNLOADING)
-        
-        stats = f"""Total Files: {total}
-✅ Completed: {completed}
-⏳ Pending: {pending}
-⬇️ Downloading: {downloading}
-⏭️ Skipped: {skipped}
-❌ Failed: {failed}
-
-Success Rate: {(completed/(total or 1))*100:.1f}%"""
-        
-        self.stats_text.delete('1.0', tk.END)
-        self.stats_text.insert('1.0', stats)
+        completed = self.status_counts[DownloadStatus.COMPLETED]
+        failed = self.status_counts[DownloadStatus.FAILED]
+        skipped = self.status_counts[DownloadStatus.SKIPPED]
+        pending = self.status_counts[DownloadStatus.PENDING]
+        downloading = self.status_counts[DownloadStatus.DOWNLOADING]
+        
+        values = {
+            'total': total, 'completed': completed, 'pending': pending,
+            'downloading': downloading, 'skipped': skipped, 'failed': failed,
+            'rate': f"{(completed/(total or 1))*100:.1f}%",
+        }
+        # Labels follow their variables; only set the ones whose value changed
+        for key, value in values.items():
+            if self._shown_stats.get(key) != value:
+                self._shown_stats[key] = value
+                self.stat_vars[key].set(value)
         
     def load_urls(self):
         """Load URLs from text file or scrape from main page"""
-        urls = []
+        # dict keys keep the load order and drop repeated URLs
+        urls = {}
         
         # Load from text file
         txt_file = self.txt_file_var.get()
         if txt_file and os.path.exists(txt_file):
-            urls.extend(read_urls_from_txt(txt_file))
+            for url in read_urls_from_txt(txt_file):
+                urls.setdefault(url, None)
             self.log(f"Loaded {len(urls)} URLs from text file", 'success')
         
         # Scrape from main page
@@ -412,7 +502,8 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
                 
                 driver = setup_driver(download_dir, headless=True)
                 scraped = scrape_links(driver, main_url)
-                urls.extend(scraped)
+                for url in scraped:
+                    urls.setdefault(url, None)
                 driver.quit()
                 self.log(f"Scraped {len(scraped)} URLs from main page", 'success')
             except Exception as e:
@@ -422,45 +513,45 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
             messagebox.showwarning("No URLs", "No URLs found. Please provide a text file or main page URL.")
             return
         
-        # Remove duplicates
-        urls = list(dict.fromkeys(urls))
-        
         # Create download items
         self.download_items.clear()
         for url in urls:
             item = DownloadItem(url)
             self.download_items.append(item)
+        with self._status_lock:
+            self.status_counts = Counter({DownloadStatus.PENDING: len(self.download_items)})
         
         self.update_queue_display()
         self.update_statistics()
         self.log(f"Loaded {len(self.download_items)} unique URLs", 'success')
         
     def update_queue_display(self):
-        """Update the queue treeview"""
-        # Clear existing items
-        for item in self.queue_tree.get_children():
-            self.queue_tree.delete(item)
-        
-        # Add items
+        """Fill the queue treeview from scratch (after loading URLs)"""
+        self.queue_tree.delete(*self.queue_tree.get_children())
         for idx, item in enumerate(self.download_items, 1):
-            status_icon = {
-                DownloadStatus.PENDING: '⏳',
-                DownloadStatus.DOWNLOADING: '⬇️',
-                DownloadStatus.COMPLETED: '✅',
-                DownloadStatus.FAILED: '❌',
-                DownloadStatus.SKIPPED: '⏭️'
-            }.get(item.status, '❓')
-            
-            size_str = f"{item.size:.1f}MB" if item.size > 0 else "-"
-            progress_str = f"{item.progress}%" if item.progress > 0 else "-"
-            
-            self.queue_tree.insert(
+            item.row = self.queue_row_values(item)
+            item.iid = self.queue_tree.insert(
                 '',
                 tk.END,
                 text=str(idx),
-                values=(item.filename, f"{status_icon} {item.status}", progress_str, size_str),
+                values=item.row,
                 tags=(item.status,)
             )
+            
+    def update_queue_item(self, item: DownloadItem):
+        """Update the one row of item, if it shows anything different"""
+        if item.iid is None:
+            return
+        values = self.queue_row_values(item)
+        if values != item.row:
+            item.row = values
+            self.queue_tree.item(item.iid, values=values, tags=(item.status,))
+            
+    def queue_row_values(self, item: DownloadItem) -> tuple:
+        status_icon = _STATUS_ICON.get(item.status, '❓')
+        size_str = f"{item.size:.1f}MB" if item.size > 0 else "-"
+        progress_str = f"{item.progress}%" if item.progress > 0 else "-"
+        return (item.filename, f"{status_icon} {item.status}", progress_str, size_str)
         
     def clean_crdownload_files(self):
         """Clean .crdownload and temporary files"""
@@ -471,11 +562,11 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
         
         removed = []
         try:
-            for file in os.listdir(output_dir):
-                if file.endswith(('.crdownload', '.part', '.tmp')):
-                    file_path = os.path.join(output_dir, file)
-                    os.remove(file_path)
-                    removed.append(file)
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.crdownload', '.part', '.tmp')) and entry.is_file():
+                        os.unlink(entry.path)
+                        removed.append(entry.name)
             
             if removed:
                 self.log(f"Cleaned {len(removed)} temporary files", 'success')
@@ -487,17 +578,68 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
             messagebox.showerror("Error", f"Failed to clean files: {e}")
     
     def calculate_checksum(self, file_path: str) -> str:
-        """Calculate SHA256 checksum"""
-        sha256 = hashlib.sha256()
+        """Calculate SHA256 checksum, reusing the cached one while size and mtime match"""
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+            key = os.path.abspath(file_path)
+            st = os.stat(key)
+            cached = self._checksum_cache.get(key)
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                return cached[2]
+            # Unbuffered: file_digest does its own reads and hashes without the GIL
+            with open(key, 'rb', buffering=0) as f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    checksum = hashlib.file_digest(f, 'sha256').hexdigest()
+                else:
+                    # 1 MiB reusable buffer: few syscalls, no per-chunk allocation
+                    sha256 = hashlib.sha256()
+                    buf = bytearray(1 << 20)
+                    view = memoryview(buf)
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        sha256.update(view[:n])
+                    checksum = sha256.hexdigest()
+            self._checksum_cache[key] = (st.st_size, st.st_mtime_ns, checksum)
+            self._hash_cache_dirty = True
+            return checksum
         except Exception as e:
-            self.log(f"Checksum error: {e}", 'error')
+            self.gui_queue.put(('log', f"Checksum error: {e}", 'error'))  # runs on hash_pool
             return None
     
+    def load_hash_cache(self, download_dir: Path):
+        """Read the checksum sidecar of download_dir (path -> size, mtime_ns, sha256)"""
+        self._hash_cache_dirty = False
+        try:
+            entries = json.loads((download_dir / HASH_CACHE_FILE).read_text())
+            self._checksum_cache = {key: tuple(entry) for key, entry in entries.items()}
+        except (OSError, ValueError):
+            self._checksum_cache = {}
+    
+    def save_hash_cache(self, download_dir: Path):
+        """Rewrite the sidecar if this batch hashed anything new"""
+        if not self._hash_cache_dirty:
+            return
+        self._hash_cache_dirty = False
+        entries = {key: entry for key, entry in list(self._checksum_cache.items()) if os.path.exists(key)}
+        tmp_path = download_dir / (HASH_CACHE_FILE + '.tmp')
+        try:
+            tmp_path.write_text(json.dumps(entries, separators=(',', ':')))
+            os.replace(tmp_path, download_dir / HASH_CACHE_FILE)
+        except OSError as e:
+            self.gui_queue.put(('log', f"Could not save checksum cache: {e}", 'warning'))
+    
+    def verify_item(self, item: DownloadItem, file_path: str):
+        """Hash a finished download on hash_pool, then mark it completed"""
+        item.checksum = self.calculate_checksum(file_path)
+        self.set_status(item, DownloadStatus.COMPLETED)
+        item.end_time = time.time()
+        self.gui_queue.put(('log', f"✅ Completed: {item.filename} ({item.size:.1f}MB)", 'success'))
+        self.gui_queue.put(('update_item', item))
+        self.gui_queue.put(('update_stats', None))
+    
     def start_downloads(self):
         """Start the download process"""
         if not self.download_items:
@@ -518,6 +660,19 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
         self.download_thread = threading.Thread(target=self.download_worker, daemon=True)
         self.download_thread.start()
         
+    def _temp_downloads(self, directory):
+        """Names of the .crdownload files currently in directory"""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.name.endswith('.crdownload')}
+
+    def _wait_until_idle(self, directory, timeout, ignore=frozenset()):
+        """Wait until no .crdownload files other than ignore remain in directory (or timeout)"""
+        deadline = time.monotonic() + timeout
+        while self.is_downloading and time.monotonic() < deadline:
+            if not self._temp_downloads(directory) - ignore:
+                return
+            time.sleep(0.1)
+        
     def download_worker(self):
         """Worker thread for downloads"""
         download_dir = Path(self.output_var.get())
@@ -526,13 +681,16 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
         # Clean .crdownload if enabled
         if self.clean_cr_var.get():
             self.gui_queue.put(('log', 'Cleaning temporary files...', 'info'))
-            for file in os.listdir(download_dir):
-                if file.endswith(('.crdownload', '.part', '.tmp')):
-                    try:
-                        os.remove(download_dir / file)
-                    except:
-                        pass
-        
+            with os.scandir(download_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.crdownload', '.part', '.tmp')) and entry.is_file():
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass  # the browser still has it open
+        
+        self.load_hash_cache(download_dir)
+        pending_hashes = []
         try:
             self.driver = setup_driver(
                 download_dir,
@@ -542,6 +700,7 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
             
             downloads_since_refresh = 0
             session_refresh = self.session_refresh_var.get()
+            verify = self.checksum_var.get()
             
             for idx, item in enumerate(self.download_items):
                 if not self.is_downloading:
@@ -553,64 +712,71 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
                 # Check if file exists
                 existing = check_file_exists(download_dir, item.url)
                 if existing and not existing.endswith(('.crdownload', '.part', '.tmp')):
-                    item.status = DownloadStatus.SKIPPED
+                    self.set_status(item, DownloadStatus.SKIPPED)
                     file_path = download_dir / existing
                     if file_path.exists():
                         item.size = os.path.getsize(file_path) / (1024 * 1024)
                     self.gui_queue.put(('log', f"Skipped (exists): {item.filename}", 'warning'))
-                    self.gui_queue.put(('update_queue', None))
+                    self.gui_queue.put(('update_item', item))
                     continue
                 
                 # Update status
-                item.status = DownloadStatus.DOWNLOADING
+                self.set_status(item, DownloadStatus.DOWNLOADING)
                 item.start_time = time.time()
-                self.gui_queue.put(('update_queue', None))
+                self.gui_queue.put(('update_item', item))
                 self.gui_queue.put(('log', f"Downloading: {item.filename}", 'info'))
                 
                 # Session refresh
                 if downloads_since_refresh >= session_refresh:
                     self.gui_queue.put(('log', 'Refreshing browser session...', 'info'))
-                    self.driver.quit()
-                    time.sleep(1)
+                    quit_driver(self.driver)
                     self.driver = setup_driver(download_dir, headless=self.headless_var.get())
                     downloads_since_refresh = 0
                 
-                # Download
+                # Download; leftovers from earlier items must not hold up the idle wait
+                stale = self._temp_downloads(download_dir)
                 result = click_download_button(self.driver, item.url, download_dir)
                 
                 if result is True:
-                    item.status = DownloadStatus.COMPLETED
                     downloads_since_refresh += 1
                     
                     # Get file info
                     downloaded = check_file_exists(download_dir, item.url)
-                    if downloaded:
-                        file_path = download_dir / downloaded
-                        if file_path.exists():
-                            item.size = os.path.getsize(file_path) / (1024 * 1024)
-                            
-                            # Calculate checksum if enabled
-                            if self.checksum_var.get():
-                                self.gui_queue.put(('log', f'Verifying checksum for {downloaded}', 'info'))
-                                item.checksum = self.calculate_checksum(str(file_path))
+                    file_path = download_dir / downloaded if downloaded else None
+                    if file_path and file_path.exists():
+                        item.size = os.path.getsize(file_path) / (1024 * 1024)
+                    else:
+                        file_path = None
                     
-                    self.gui_queue.put(('log', f"✅ Completed: {item.filename} ({item.size:.1f}MB)", 'success'))
+                    if verify and file_path:
+                        # Hashed on hash_pool while the next item downloads;
+                        # verify_item marks this one completed when it is done
+                        self.gui_queue.put(('log', f'Verifying checksum for {downloaded}', 'info'))
+                        pending_hashes.append(self.hash_pool.submit(self.verify_item, item, str(file_path)))
+                    else:
+                        self.set_status(item, DownloadStatus.COMPLETED)
+                        self.gui_queue.put(('log', f"✅ Completed: {item.filename} ({item.size:.1f}MB)", 'success'))
                 else:
-                    item.status = DownloadStatus.FAILED
+                    self.set_status(item, DownloadStatus.FAILED)
                     item.error = "Download failed"
                     self.gui_queue.put(('log', f"❌ Failed: {item.filename}", 'error'))
                 
                 item.end_time = time.time()
-                self.gui_queue.put(('update_queue', None))
+                self.gui_queue.put(('update_item', item))
                 self.gui_queue.put(('update_stats', None))
                 
-                time.sleep(2)
+                # Nothing to settle after a failed item
+                if result is True:
+                    self._wait_until_idle(download_dir, timeout=self.settings['max_wait'], ignore=stale)
             
         except Exception as e:
             self.gui_queue.put(('log', f"Error: {e}", 'error'))
         finally:
             if self.driver:
                 self.driver.quit()
+            # verify_item posts its own messages, so it must finish before the summary
+            concurrent.futures.wait(pending_hashes)
+            self.save_hash_cache(download_dir)
             self.gui_queue.put(('download_complete', None))
     
     def pause_downloads(self):
@@ -645,26 +811,45 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
     
     def check_queue(self):
         """Check GUI queue for updates from worker thread"""
+        # Collect the whole backlog first; each widget is then updated once per tick
+        log_entries = []
+        dirty_items = {}
+        need_stats = False
+        status = None
+        progress = None
+        finished = False
         try:
             while True:
                 msg_type, *args = self.gui_queue.get_nowait()
                 
                 if msg_type == 'log':
-                    self.log(*args)
+                    log_entries.append(args)
                 elif msg_type == 'status':
-                    self.update_status(args[0])
+                    status = args[0]
                 elif msg_type == 'progress':
-                    self.progress_bar['value'] = args[0]
-                elif msg_type == 'update_queue':
-                    self.update_queue_display()
+                    progress = args[0]
+                elif msg_type == 'update_item':
+                    dirty_items[id(args[0])] = args[0]
                 elif msg_type == 'update_stats':
-                    self.update_statistics()
+                    need_stats = True
                 elif msg_type == 'download_complete':
-                    self.on_download_complete()
+                    finished = True
                     
         except queue.Empty:
             pass
         
+        if log_entries:
+            self.write_log(log_entries)
+        for item in dirty_items.values():
+            self.update_queue_item(item)
+        if need_stats:
+            self.update_statistics()
+        if status is not None:
+            self.update_status(status)
+        if progress is not None:
+            self.progress_bar['value'] = progress
+        if finished:
+            self.on_download_complete()
         self.root.after(100, self.check_queue)
     
     def on_download_complete(self):
@@ -678,9 +863,9 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
         self.log("All downloads finished", 'success')
         
         # Show summary
-        completed = sum(1 for item in self.download_items if item.status == DownloadStatus.COMPLETED)
-        failed = sum(1 for item in self.download_items if item.status == DownloadStatus.FAILED)
-        skipped = sum(1 for item in self.download_items if item.status == DownloadStatus.SKIPPED)
+        completed = self.status_counts[DownloadStatus.COMPLETED]
+        failed = self.status_counts[DownloadStatus.FAILED]
+        skipped = self.status_counts[DownloadStatus.SKIPPED]
         
         messagebox.showinfo(
             "Downloads Complete",
@@ -694,7 +879,8 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
         try:
             if os.path.exists('downloader_settings.json'):
                 with open('downloader_settings.json', 'r') as f:
-                    settings = json.load(f)
+                    self._last_settings_blob = f.read()
+                    settings = json.loads(self._last_settings_blob)
                     self.output_var.set(settings.get('output_dir', ''))
                     self.headless_var.set(settings.get('headless', True))
                     self.session_refresh_var.set(settings.get('session_refresh', 10))
@@ -711,9 +897,33 @@ Success Rate: {(completed/(total or 1))*100:.1f}%"""
                 'verify_checksum': self.checksum_var.get(),
                 'clean_crdownload': self.clean_cr_var.get()
             }
-            with open('downloader_settings.json', 'w') as f:
-                json.dump(settings, f, indent=2)
-        except:
+            # Encode up front: one write() instead of json.dump's write per token;
+            # compact separators since the file is only ever read back by us
+            data = json.dumps(settings, separators=(',', ':'))
+            if data == self._last_settings_blob:
+                return  # same as what is already on disk
+            # Write beside the real file and swap it in: a crash mid-write can't
+            # truncate the settings, so no fsync is needed on this path
+            with open('downloader_settings.json.tmp', 'w') as f:
+                f.write(data)
+            os.replace('downloader_settings.json.tmp', 'downloader_settings.json')
+            self._last_settings_blob = data
+        except (OSError, TypeError, ValueError, tk.TclError) as e:
+            print(f"Could not save settings: {e}", file=sys.stderr)
+            try:
+                os.remove('downloader_settings.json.tmp')
+            except OSError:
+                pass
+    
+    def sync_settings(self):
+        """Flush the settings file to disk once, at shutdown"""
+        try:
+            fd = os.open('downloader_settings.json', os.O_RDWR)  # Windows can't fsync read-only fds
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
             pass
 
 
@@ -742,6 +952,8 @@ def main():
     root.geometry(f'{width}x{height}+{x}+{y}')
     
     root.mainloop()
+    app.sync_settings()
+    app.hash_pool.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":
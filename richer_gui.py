@@ -3,13 +3,17 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 from tkinter.font import Font
 import threading
 import queue
+import concurrent.futures
+from collections import Counter, deque
 import os
 import time
 import hashlib
 import json
+import mmap
+import multiprocessing
+import sys
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 import webbrowser
 
 # Import your existing selenium downloader functions
@@ -17,16 +21,61 @@ import webbrowser
 try:
     from cli import (
         setup_driver, scrape_links, click_download_button, 
-        check_file_exists, get_filename_from_url, read_urls_from_txt
+        check_file_exists, get_filename_from_url, read_urls_from_txt,
+        download_direct, is_direct_download, quit_driver
     )
 except ImportError:
     # Fallback for testing UI without the cli module
     def setup_driver(*args, **kwargs): return None
-    def scrape_links(*args): return []
+    def scrape_links(*args, **kwargs): return []
     def click_download_button(*args): return True
     def check_file_exists(*args): return False
     def get_filename_from_url(url): return "test_file.zip"
     def read_urls_from_txt(*args): return []
+    def download_direct(*args, **kwargs): return None
+    def is_direct_download(*args, **kwargs): return False
+    def quit_driver(*args, **kwargs): pass
+
+# orjson is optional; both paths produce compact UTF-8 JSON bytes
+try:
+    import orjson
+    def dump_json(obj) -> bytes: return orjson.dumps(obj)
+except ImportError:
+    def dump_json(obj) -> bytes: return json.dumps(obj, separators=(',', ':')).encode()
+
+# Activity log is trimmed by LOG_TRIM_LINES once it grows past LOG_MAX_LINES;
+# the last LOG_MAX_LINES messages are also kept in a ring to redraw it from
+LOG_MAX_LINES = 2000
+LOG_TRIM_LINES = 500
+
+SETTINGS_FILE = Path('downloader_settings.json')
+# Edits are saved once the settings have been left alone this long (ms)
+SETTINGS_DEBOUNCE_MS = 500
+
+# Workers wake the GUI with <<QueueEvent>>; this slow poll only backs that up (ms)
+QUEUE_WATCHDOG_MS = 1000
+
+# Sidecar in the output folder: path -> (size, mtime_ns, sha256) of verified files
+HASH_CACHE_FILE = '.repack_hashes.json'
+
+# Parallel HTTP workers for links that serve the file directly
+DIRECT_WORKERS = 4
+
+# Browsers (one thread each) working through links that need a button click
+BROWSER_WORKERS = 3
+
+# Folder inside the output folder where each browser downloads into a w<n>
+# subfolder of its own, so it never mistakes another's file for its download;
+# direct HTTP downloads stream their .part files into its 'direct' subfolder
+STAGING_DIR = '.repack_staging'
+
+# Read size for the checksum fallback loop (Python < 3.11)
+CHECKSUM_CHUNK = 1 << 20
+# Above this the fallback maps the file instead (64-bit builds only)
+CHECKSUM_MMAP_MIN = 1 << 30
+
+# Processes verifying checksums side by side
+HASH_WORKERS = min(4, os.cpu_count() or 1)
 
 class DownloadStatus:
     PENDING = "pending"
@@ -35,9 +84,18 @@ class DownloadStatus:
     FAILED = "failed"
     SKIPPED = "skipped"
 
+    ALL = (PENDING, DOWNLOADING, COMPLETED, FAILED, SKIPPED)
+
 
 class DownloadItem:
+    __slots__ = ('url', 'filename', 'status', 'progress', 'size', 'checksum',
+                 'error', 'start_time', 'end_time', 'iid', 'row')
+
     def __init__(self, url: str, filename: str = None):
+        self.reset(url, filename)
+
+    def reset(self, url: str, filename: str = None):
+        """(Re)initialise every field, so pooled instances can be reused"""
         self.url = url
         self.filename = filename or get_filename_from_url(url) or url[:50]
         self.status = DownloadStatus.PENDING
@@ -47,9 +105,55 @@ class DownloadItem:
         self.error = None
         self.start_time = None
         self.end_time = None
+        self.iid = None  # queue_tree row id
+        self.row = None  # values last written to that row
+
 
+def _sha256_file(file_path: str) -> str:
+    """SHA256 of file_path (module level so hash_pool processes can run it)"""
+    # O_SEQUENTIAL is the Windows sequential-scan hint; elsewhere posix_fadvise does it
+    flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+    fadvise = getattr(os, 'posix_fadvise', None)
+    with os.fdopen(os.open(file_path, flags), 'rb', buffering=0) as f:
+        if fadvise:
+            fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        checksum = _sha256_stream(f)
+        if fadvise:
+            # Read only to be hashed: let the kernel drop it from the page cache
+            fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return checksum
+
+def _sha256_stream(f) -> str:
+    # f is unbuffered: file_digest reads into its own buffer and hashes in C
+    # (OpenSSL, SHA-NI where available) with the GIL released
+    if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+    sha256 = hashlib.sha256()
+    # Large file, 64-bit address space: hand the whole mapping to one update()
+    if sys.maxsize > 2**32 and os.fstat(f.fileno()).st_size >= CHECKSUM_MMAP_MIN:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            sha256.update(mapped)
+        return sha256.hexdigest()
+    # One reusable buffer: no bytes object allocated per chunk
+    buf = bytearray(CHECKSUM_CHUNK)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        sha256.update(view[:n])
+    return sha256.hexdigest()
 
 class DownloaderGUI:
+    # Status column text, looked up per row instead of formatted
+    _STATUS_DISPLAY = {
+        DownloadStatus.PENDING: "⏳ PENDING",
+        DownloadStatus.DOWNLOADING: "⬇ DOWNLOADING",
+        DownloadStatus.COMPLETED: "✔ COMPLETED",
+        DownloadStatus.FAILED: "✖ FAILED",
+        DownloadStatus.SKIPPED: "⏭ SKIPPED"
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title("🔥 Repack Manager")
@@ -77,12 +181,55 @@ class DownloaderGUI:
 
         # Queue for thread-safe GUI updates
         self.gui_queue = queue.Queue()
+        self._queue_signalled = False  # a <<QueueEvent>> is already on its way
+        self._log_scroll_pending = False
+        self._log_ring = deque(maxlen=LOG_MAX_LINES)  # (ts, tag, text, tag) per message
+        self._log_stale = False  # messages arrived while the user was scrolled up
         
         # Download state
         self.download_items: List[DownloadItem] = []
+        self._item_pool: List[DownloadItem] = []  # recycled on reload
+        self._queued_urls = set()  # urls of download_items, for streamed-in links
+        # Per-status totals, kept in step by set_status()
+        self.status_counts = Counter(dict.fromkeys(DownloadStatus.ALL, 0))
+        self._status_lock = threading.Lock()
         self.is_downloading = False
-        self.driver = None
+        self.stop_event = threading.Event()  # set by pause/stop, polled by workers
+        # set by stop/quit: also aborts direct transfers that are streaming
+        self.abort_event = threading.Event()
+        # a cancelled quit held the batch back; restart what it left PENDING
+        self._resume_pending = False
+        # quit dialog is up; a batch ending meanwhile waits for its answer
+        self._held = False
+        self._done_while_held = False
+        self.drivers = []  # live browsers, so stop_downloads can close them
+        self._claim_lock = threading.Lock()  # browsers picking names in the output folder
         self.download_thread = None
+        self.halt_thread = None  # closes browsers once quitting is confirmed
+
+        # Checksums run here so the browser can move on to the next URL
+        self.hash_pool = concurrent.futures.ProcessPoolExecutor(max_workers=HASH_WORKERS)
+
+        # Settings bytes last read or written, to skip no-op saves
+        self._last_settings_blob: Optional[bytes] = None
+        # Pending debounced save_settings call, if any
+        self._save_after_id = None
+        # Settings dicts for the writer thread; None tells it to finish
+        self._settings_queue = queue.Queue()
+        # Settings file kept open by the writer and rewritten in place; the
+        # crash-safe tmp+replace copy is only made once, at shutdown
+        self._settings_fd: Optional[int] = None
+        self._settings_dirty = False
+
+        # path -> (size, mtime_ns, sha256) of files already verified, mirrored to
+        # HASH_CACHE_FILE in the output folder so unchanged files are never hashed twice
+        self._checksum_cache: Dict[str, Tuple[int, int, str]] = {}
+        self._hash_cache_path: Optional[Path] = None
+        self._hash_cache_dirty = False
+
+        # Log timestamp, formatted at most once per second
+        self._ts_sec = 0
+        self._ts_str = ''
         
         # Settings
         self.settings = {
@@ -97,6 +244,13 @@ class DownloaderGUI:
         self.configure_styles()
         self.setup_ui()
         self.load_settings()
+        self.settings_thread = threading.Thread(
+            target=self.settings_writer, name='SettingsWriter', daemon=True
+        )
+        self.settings_thread.start()
+        for var in (self.output_var, self.headless_var, self.session_refresh_var):
+            var.trace_add('write', self.schedule_save_settings)
+        self.root.bind('<<QueueEvent>>', lambda event: self.drain_queue())
         self.check_queue()
 
     def configure_styles(self):
@@ -104,11 +258,20 @@ class DownloaderGUI:
         style = ttk.Style()
         style.theme_use('clam')  # 'clam' provides the most control over colors
 
+        # Named fonts, created once and shared by every style and widget below
+        self.font_body = Font(family='Segoe UI', size=10)
+        self.font_body_bold = Font(family='Segoe UI', size=10, weight='bold')
+        self.font_heading = Font(family='Segoe UI', size=11, weight='bold')
+        self.font_small = Font(family='Segoe UI', size=9)
+        self.font_small_bold = Font(family='Segoe UI', size=9, weight='bold')
+        self.font_title = Font(family='Segoe UI', size=16, weight='bold')
+        self.font_mono = Font(family='Consolas', size=9)
+
         # General Styles
         style.configure('.', 
             background=self.colors['bg_dark'], 
             foreground=self.colors['fg_primary'],
-            font=('Segoe UI', 10)
+            font=self.font_body
         )
 
         # Label Frames
@@ -121,12 +284,17 @@ class DownloaderGUI:
         style.configure('TLabelframe.Label', 
             background=self.colors['bg_dark'], 
             foreground=self.colors['accent'],
-            font=('Segoe UI', 11, 'bold')
+            font=self.font_heading
         )
 
         # Frames
         style.configure('TFrame', background=self.colors['bg_dark'])
         style.configure('Panel.TFrame', background=self.colors['bg_panel'])
+        style.configure('Stats.TLabel',
+            background=self.colors['bg_panel'],
+            foreground=self.colors['fg_primary'],
+            font=self.font_mono
+        )
 
         # Buttons (Flat Modern)
         style.configure('TButton', 
@@ -134,7 +302,7 @@ class DownloaderGUI:
             foreground='white',
             borderwidth=0,
             padding=8,
-            font=('Segoe UI', 10)
+            font=self.font_body
         )
         style.map('TButton', 
             background=[('active', self.colors['accent']), ('pressed', self.colors['select_bg'])],
@@ -145,7 +313,7 @@ class DownloaderGUI:
         style.configure('Accent.TButton', 
             background=self.colors['accent'],
             foreground='white',
-            font=('Segoe UI', 10, 'bold')
+            font=self.font_body_bold
         )
         style.map('Accent.TButton', 
             background=[('active', self.colors['accent_hover']), ('pressed', self.colors['select_bg'])]
@@ -167,7 +335,7 @@ class DownloaderGUI:
             foreground=self.colors['fg_primary'],
             borderwidth=0,
             rowheight=25,
-            font=('Segoe UI', 10)
+            font=self.font_body
         )
         style.map('Treeview', background=[('selected', self.colors['select_bg'])])
         
@@ -175,7 +343,7 @@ class DownloaderGUI:
             background=self.colors['bg_panel'],
             foreground=self.colors['fg_primary'],
             relief='flat',
-            font=('Segoe UI', 9, 'bold'),
+            font=self.font_small_bold,
             padding=5
         )
 
@@ -208,7 +376,7 @@ class DownloaderGUI:
         title_label = tk.Label(
             header_frame, 
             text="Repack Manager",
-            font=('Segoe UI', 16, 'bold'),
+            font=self.font_title,
             fg='white',
             bg=self.colors['bg_panel'],
             pady=10
@@ -319,20 +487,33 @@ class DownloaderGUI:
         stats_frame = ttk.LabelFrame(container, text="STATISTICS", padding=10)
         stats_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Styled Text widget for stats
-        self.stats_text = tk.Text(
-            stats_frame, 
-            height=8, 
-            width=30,
-            wrap=tk.WORD, 
-            font=('Consolas', 9),
-            bg=self.colors['bg_panel'],
-            fg=self.colors['fg_primary'],
-            bd=0,
-            highlightthickness=0,
-            state=tk.DISABLED
-        )
-        self.stats_text.pack(fill=tk.BOTH, expand=True)
+        # One label pair per counter, each value bound to a Tk variable
+        stats_grid = ttk.Frame(stats_frame, style='Panel.TFrame', padding=6)
+        stats_grid.pack(fill=tk.BOTH, expand=True)
+        stats_grid.columnconfigure(1, weight=1)
+        
+        self.var_total = tk.IntVar(value=0)
+        self.var_completed = tk.IntVar(value=0)
+        self.var_downloading = tk.IntVar(value=0)
+        self.var_pending = tk.IntVar(value=0)
+        self.var_skipped = tk.IntVar(value=0)
+        self.var_failed = tk.IntVar(value=0)
+        self.var_rate = tk.StringVar(value="0.0%")
+        
+        stats_rows = [
+            ("TOTAL FILES", self.var_total),
+            ("COMPLETED", self.var_completed),
+            ("DOWNLOADING", self.var_downloading),
+            ("PENDING", self.var_pending),
+            ("SKIPPED", self.var_skipped),
+            ("FAILED", self.var_failed),
+            ("SUCCESS RATE", self.var_rate),
+        ]
+        for row, (label, var) in enumerate(stats_rows):
+            ttk.Label(stats_grid, text=label, style='Stats.TLabel').grid(row=row, column=0, sticky=tk.W)
+            ttk.Label(stats_grid, textvariable=var, style='Stats.TLabel').grid(row=row, column=1, sticky=tk.E)
+        
+        self._shown_stats = {}
         self.update_statistics()
         
     def setup_right_panel(self, parent):
@@ -381,7 +562,7 @@ class DownloaderGUI:
             log_frame,
             wrap=tk.WORD,
             height=10,
-            font=('Consolas', 9),
+            font=self.font_mono,
             bg='#000000', # Slightly darker for log terminal feel
             fg=self.colors['fg_primary'],
             insertbackground='white',
@@ -389,6 +570,7 @@ class DownloaderGUI:
             highlightthickness=0
         )
         self.log_text.pack(fill=tk.BOTH, expand=True)
+        self.log_text.configure(yscrollcommand=self.on_log_yscroll)
         
         # Configure log tags
         self.log_text.tag_config('info', foreground=self.colors['accent'])
@@ -410,7 +592,7 @@ class DownloaderGUI:
             padx=15,
             bg=self.colors['accent'],
             fg='white',
-            font=('Segoe UI', 9)
+            font=self.font_small
         )
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
@@ -421,33 +603,38 @@ class DownloaderGUI:
         )
         self.progress_bar.pack(side=tk.RIGHT, padx=15, pady=5)
 
+    def set_status(self, item: DownloadItem, status: str):
+        """Change an item's status and keep status_counts in step (any thread)"""
+        with self._status_lock:
+            self.status_counts[item.status] -= 1
+            item.status = status
+            self.status_counts[status] += 1
+
     def update_statistics(self):
         """Update statistics display"""
         total = len(self.download_items)
-        completed = sum(1 for item in self.download_items if item.status == DownloadStatus.COMPLETED)
-        failed = sum(1 for item in self.download_items if item.status == DownloadStatus.FAILED)
-        skipped = sum(1 for item in self.download_items if item.status == DownloadStatus.SKIPPED)
-        pending = sum(1 for item in self.download_items if item.status == DownloadStatus.PENDING)
-        downloading = sum(1 for item in self.download_items if item.status == DownloadStatus.DOWNLOADING)
+        completed = self.status_counts[DownloadStatus.COMPLETED]
+        failed = self.status_counts[DownloadStatus.FAILED]
+        skipped = self.status_counts[DownloadStatus.SKIPPED]
+        pending = self.status_counts[DownloadStatus.PENDING]
+        downloading = self.status_counts[DownloadStatus.DOWNLOADING]
         
         rate = (completed/(total or 1))*100
         
-        stats = f"""
- TOTAL FILES : {total}
- ──────────────────────
- COMPLETED   : {completed}
- DOWNLOADING : {downloading}
- PENDING     : {pending}
- SKIPPED     : {skipped}
- FAILED      : {failed}
- ──────────────────────
- SUCCESS RATE: {rate:.1f}%
-        """
-        
-        self.stats_text.config(state=tk.NORMAL)
-        self.stats_text.delete('1.0', tk.END)
-        self.stats_text.insert('1.0', stats)
-        self.stats_text.config(state=tk.DISABLED)
+        values = (
+            (self.var_total, total),
+            (self.var_completed, completed),
+            (self.var_downloading, downloading),
+            (self.var_pending, pending),
+            (self.var_skipped, skipped),
+            (self.var_failed, failed),
+            (self.var_rate, f"{rate:.1f}%"),
+        )
+        # Only push counters that actually moved; each set() is a Tcl round trip
+        for var, value in values:
+            if self._shown_stats.get(str(var)) != value:
+                self._shown_stats[str(var)] = value
+                var.set(value)
 
     # -------------------------------------------------------------------------
     #  LOGIC METHODS (Unchanged functionality, slightly adapted for styling)
@@ -467,25 +654,84 @@ class DownloaderGUI:
             self.output_var.set(directory)
             
     def log(self, message: str, level: str = 'info'):
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.log_text.insert(tk.END, f'{timestamp} ', 'timestamp')
-        self.log_text.insert(tk.END, f'{message}\n', level)
+        self.write_log([(message, level)])
+
+    def write_log(self, entries):
+        """Record (message[, level]) entries; the widget only gets them while it follows the end"""
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime('%H:%M:%S ', time.localtime(now))
+        chunks = []
+        for message, *level in entries:
+            entry = (self._ts_str, 'timestamp', f'{message}\n', level[0] if level else 'info')
+            self._log_ring.append(entry)
+            chunks += entry
+
+        # Scrolled up to read: leave the widget alone until the user comes back down
+        if not self._log_scroll_pending and self.log_text.yview()[1] < 1.0:
+            self._log_stale = True
+            return
+        if self._log_stale:
+            self.render_log()
+            return
+        self.log_text.insert(tk.END, *chunks)
+
+        # Drop old lines in one bulk delete so the widget stays bounded
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > LOG_MAX_LINES:
+            first_kept = line_count - LOG_MAX_LINES + LOG_TRIM_LINES
+            self.log_text.delete('1.0', f'{first_kept}.0')
+
+        # One see() per idle cycle, however many writes came in
+        if not self._log_scroll_pending:
+            self._log_scroll_pending = True
+            self.root.after_idle(self.scroll_log)
+
+    def scroll_log(self):
+        self._log_scroll_pending = False
         self.log_text.see(tk.END)
+
+    def render_log(self):
+        """Redraw the widget from the ring buffer if messages were held back"""
+        if not self._log_stale:
+            return
+        self._log_stale = False
+        self.log_text.delete('1.0', tk.END)
+        if self._log_ring:
+            self.log_text.insert(tk.END, *[part for entry in self._log_ring for part in entry])
+        if not self._log_scroll_pending:
+            self._log_scroll_pending = True
+            self.root.after_idle(self.scroll_log)
+
+    def on_log_yscroll(self, first, last):
+        self.log_text.vbar.set(first, last)
+        if self._log_stale and float(last) >= 1.0:
+            self.root.after_idle(self.render_log)
         
     def update_status(self, message: str):
         self.status_label.config(text=message)
         
     def load_urls(self):
-        urls = []
+        # Insertion-ordered dict: duplicates are dropped as URLs arrive
+        urls = {}
         
         # Load from text file
         txt_file = self.txt_file_var.get()
         if txt_file and os.path.exists(txt_file):
-            urls.extend(read_urls_from_txt(txt_file))
+            for url in read_urls_from_txt(txt_file):
+                urls.setdefault(url, None)
             self.log(f"Loaded {len(urls)} URLs from text file", 'success')
         
-        # Scrape from main page
         main_url = self.url_entry.get().strip()
+        if not urls and not main_url:
+            messagebox.showwarning("No Input", "Please provide a text file or URL.")
+            return
+
+        if not self.process_loaded_urls(urls):
+            return
+        
+        # Scrape from main page; links are appended to the queue as they are found
         if main_url:
             self.log("Scraping main page...", 'info')
             
@@ -496,76 +742,155 @@ class DownloaderGUI:
                     temp_dir = Path(self.output_var.get() or "./downloads")
                     temp_dir.mkdir(parents=True, exist_ok=True)
                     
-                    self.gui_queue.put(('status', "Initializing scraper..."))
+                    self.post(('status', "Initializing scraper..."))
                     driver = setup_driver(temp_dir, headless=True)
                     
-                    self.gui_queue.put(('status', f"Scraping {main_url}..."))
-                    scraped = scrape_links(driver, main_url)
+                    self.post(('status', f"Scraping {main_url}..."))
+                    scraped = scrape_links(
+                        driver, main_url,
+                        on_link=lambda url: self.post(('add_item', url))
+                    )
                     
                     driver.quit()
-                    self.gui_queue.put(('scrape_result', scraped))
+                    self.post(('log', f"Scraped {len(scraped)} links", 'success'))
+                    self.post(('status', "Scraping finished"))
                 except Exception as e:
-                    self.gui_queue.put(('log', f"Error scraping: {e}", 'error'))
-                    self.gui_queue.put(('status', "Scraping failed"))
+                    self.post(('log', f"Error scraping: {e}", 'error'))
+                    self.post(('status', "Scraping failed"))
 
             threading.Thread(target=scrape_worker, daemon=True).start()
-            return
-            
-        if not urls and not main_url:
-            messagebox.showwarning("No Input", "Please provide a text file or URL.")
-            return
 
-        self.process_loaded_urls(urls)
+    def process_loaded_urls(self, urls) -> bool:
+        """Replace the queue with items for urls (already de-duplicated)"""
+        if self.download_thread is not None and self.download_thread.is_alive():
+            # Items are recycled below, so they must not be in use by the worker
+            self.log("Stop the current batch before loading new URLs", 'warning')
+            return False
 
-    def process_loaded_urls(self, urls):
-        urls = list(dict.fromkeys(urls)) # Deduplicate
+        self._item_pool.extend(self.download_items)
         self.download_items.clear()
         for url in urls:
-            item = DownloadItem(url)
-            self.download_items.append(item)
+            self.download_items.append(self.new_item(url))
+        self._queued_urls = set(urls)
+
+        self.status_counts = Counter(dict.fromkeys(DownloadStatus.ALL, 0))
+        self.status_counts[DownloadStatus.PENDING] = len(self.download_items)
         
         self.update_queue_display()
         self.update_statistics()
         self.log(f"Queue populated with {len(self.download_items)} items", 'success')
+        return True
+
+    def new_item(self, url: str) -> DownloadItem:
+        """A PENDING item for url, recycled from _item_pool when possible"""
+        if self._item_pool:
+            item = self._item_pool.pop()
+            item.reset(url)
+            return item
+        return DownloadItem(url)
+
+    def add_items(self, urls):
+        """Append streamed-in urls that are not queued yet, one new row each"""
+        new_items = []
+        for url in urls:
+            if url not in self._queued_urls:
+                self._queued_urls.add(url)
+                new_items.append(self.new_item(url))
+        if not new_items:
+            return
+
+        with self._status_lock:
+            self.status_counts[DownloadStatus.PENDING] += len(new_items)
+        first_idx = len(self.download_items) + 1
+        self.download_items.extend(new_items)
+        for idx, item in enumerate(new_items, first_idx):
+            self.insert_row(idx, item)
+        self.update_statistics()
         
     def update_queue_display(self):
+        """Rebuild the whole queue view; only needed when the item list is replaced"""
         # Clear existing
-        for item in self.queue_tree.get_children():
-            self.queue_tree.delete(item)
+        self.queue_tree.delete(*self.queue_tree.get_children())
         
         # Add items
         for idx, item in enumerate(self.download_items, 1):
-            size_str = f"{item.size:.1f} MB" if item.size > 0 else "-"
-            progress_str = f"{item.progress}%" if item.progress > 0 else "-"
-            
-            # Status icon mapping
-            status_map = {
-                DownloadStatus.PENDING: "⏳",
-                DownloadStatus.DOWNLOADING: "⬇",
-                DownloadStatus.COMPLETED: "✔",
-                DownloadStatus.FAILED: "✖",
-                DownloadStatus.SKIPPED: "⏭"
-            }
-            s_icon = status_map.get(item.status, "")
-            
-            self.queue_tree.insert(
-                '',
-                tk.END,
-                text=str(idx),
-                values=(item.filename, f"{s_icon} {item.status.upper()}", progress_str, size_str),
-                tags=(item.status,)
-            )
-        
-    def calculate_checksum(self, file_path: str) -> str:
-        sha256 = hashlib.sha256()
+            self.insert_row(idx, item)
+
+    def insert_row(self, idx: int, item: DownloadItem):
+        item.row = self.queue_row_values(item)
+        item.iid = self.queue_tree.insert(
+            '',
+            tk.END,
+            text=str(idx),
+            values=item.row,
+            tags=(item.status,)
+        )
+
+    def update_queue_item(self, item: DownloadItem):
+        """Refresh a single row in place instead of rebuilding the view"""
+        if item.iid is None:
+            return
+        values = self.queue_row_values(item)
+        if values == item.row:
+            return  # nothing visible changed (status is part of the values)
+        item.row = values
+        self.queue_tree.item(item.iid, values=values, tags=(item.status,))
+
+    def queue_row_values(self, item: DownloadItem) -> tuple:
+        size_str = f"{item.size:.1f} MB" if item.size > 0 else "-"
+        progress_str = f"{item.progress}%" if item.progress > 0 else "-"
+        
+        return (item.filename, self._STATUS_DISPLAY[item.status], progress_str, size_str)
+        
+    def calculate_checksum(self, file_path: str) -> concurrent.futures.Future:
+        """Hash file_path on hash_pool; unchanged files resolve at once from the cache"""
+        future = concurrent.futures.Future()
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+            key = os.path.abspath(file_path)
+            st = os.stat(key)
+            cached = self._checksum_cache.get(key)
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                future.set_result(cached[2])
+                return future
+            future = self.hash_pool.submit(_sha256_file, key)
+            future.add_done_callback(lambda f: self.remember_checksum(key, st, f))
         except Exception as e:
-            self.log(f"Checksum error: {e}", 'error')
-            return None
+            future.set_exception(e)
+        return future
+
+    def remember_checksum(self, key: str, st: os.stat_result, future: concurrent.futures.Future):
+        if future.exception() is None:
+            self.record_checksum(key, st, future.result())
+
+    def record_checksum(self, key: str, st: os.stat_result, checksum: str):
+        """Cache checksum for the file at key as it was when st was taken"""
+        self._checksum_cache[key] = (st.st_size, st.st_mtime_ns, checksum)
+        self._hash_cache_dirty = True
+
+    def on_checksum_done(self, item: DownloadItem, future: concurrent.futures.Future,
+                         done: concurrent.futures.Future):
+        # Runs on the hash_pool result thread (or inline for cached checksums).
+        # done resolves only once this has finished with item, and it runs after
+        # remember_checksum, which was registered on future first
+        try:
+            try:
+                item.checksum = future.result()
+            except Exception as e:
+                item.checksum = None
+                self.post(('log', f"Checksum error: {e}", 'error'))
+            item.end_time = time.time()
+            if item.checksum:
+                self.set_status(item, DownloadStatus.COMPLETED)
+                self.post(('log', f"Success: {item.filename}", 'success'))
+            else:
+                self.set_status(item, DownloadStatus.FAILED)
+                item.error = "Checksum failed"
+                self.post(('log', f"Failed (checksum): {item.filename}", 'error'))
+            self.post(('update_item', item))
+            self.post(('update_stats', None))
+            self.post_progress()
+        finally:
+            done.set_result(None)
     
     def start_downloads(self):
         if not self.download_items:
@@ -577,7 +902,13 @@ class DownloaderGUI:
             messagebox.showwarning("No Output", "Please select an output directory.")
             return
         
+        if self.download_thread and self.download_thread.is_alive():
+            self.log("Previous batch is still winding down, try again shortly", 'warning')
+            return
+        
         self.is_downloading = True
+        self.stop_event.clear()
+        self.abort_event.clear()
         self.start_btn.config(state=tk.DISABLED)
         self.pause_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.NORMAL)
@@ -589,100 +920,353 @@ class DownloaderGUI:
     def download_worker(self):
         download_dir = Path(self.output_var.get())
         download_dir.mkdir(parents=True, exist_ok=True)
+        dl_str = os.fspath(download_dir)  # plain string joins in the per-item loops
         
         if self.clean_cr_var.get():
-            self.gui_queue.put(('log', 'Cleaning temp files...', 'info'))
-            for file in os.listdir(download_dir):
-                if file.endswith(('.crdownload', '.part', '.tmp')):
-                    try:
-                        os.remove(download_dir / file)
-                    except: pass
-        
+            self.post(('log', 'Cleaning temp files...', 'info'))
+            with os.scandir(download_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.crdownload', '.part', '.tmp')) and entry.is_file():
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass  # still held open by the browser
+        
+        self.load_hash_cache(download_dir)
+        pending_hashes = []
         try:
-            self.driver = setup_driver(
-                download_dir,
-                headless=self.headless_var.get(),
-            )
-            
-            downloads_since_refresh = 0
-            session_refresh = self.session_refresh_var.get()
-            
-            for idx, item in enumerate(self.download_items):
-                if not self.is_downloading:
+            to_fetch = []
+            for item in self.download_items:
+                if self.stop_event.is_set():
                     break
+                # Resuming after pause/stop: finished items stay as they are
+                if item.status in (DownloadStatus.COMPLETED, DownloadStatus.SKIPPED):
+                    continue
                 
                 # Check exist
                 existing = check_file_exists(download_dir, item.url)
                 if existing and not existing.endswith(('.crdownload', '.part')):
-                    item.status = DownloadStatus.SKIPPED
-                    file_path = download_dir / existing
-                    if file_path.exists():
-                        item.size = os.path.getsize(file_path) / (1024 * 1024)
-                    self.gui_queue.put(('log', f"Skipped (exists): {item.filename}", 'warning'))
-                    self.gui_queue.put(('update_queue', None))
-                    self.gui_queue.put(('progress', int((idx/len(self.download_items))*100)))
+                    self.set_status(item, DownloadStatus.SKIPPED)
+                    try:
+                        item.size = os.path.getsize(os.path.join(dl_str, existing)) / (1024 * 1024)
+                    except OSError:
+                        pass
+                    self.post(('log', f"Skipped (exists): {item.filename}", 'warning'))
+                    self.post(('update_item', item))
+                    self.post(('update_stats', None))
+                    self.post_progress()
                     continue
+                to_fetch.append(item)
 
-                # Refresh session logic
-                if downloads_since_refresh >= session_refresh:
-                    self.gui_queue.put(('log', 'Refreshing browser session...', 'info'))
-                    self.driver.quit()
-                    time.sleep(1)
-                    self.driver = setup_driver(download_dir, headless=self.headless_var.get())
-                    downloads_since_refresh = 0
+            # Tk variables are read here, on one thread, and handed to the workers
+            options = {
+                'headless': self.headless_var.get(),
+                'session_refresh': self.session_refresh_var.get(),
+                'verify': self.checksum_var.get(),
+            }
+            browser_items = queue.Queue()
+            workers = [
+                threading.Thread(
+                    target=self.browser_worker,
+                    args=(browser_items, download_dir, n, options, pending_hashes),
+                    daemon=True,
+                )
+                for n in range(min(BROWSER_WORKERS, len(to_fetch)))
+            ]
+            for worker in workers:
+                worker.start()
+
+            # Links that serve the file directly are fetched in parallel over HTTP,
+            # while the browsers already work through the ones that need a click
+            self.post(('status', f"Checking {len(to_fetch)} links for direct downloads..."))
+            direct_dir = download_dir / STAGING_DIR / 'direct'
+            direct_dir.mkdir(parents=True, exist_ok=True)
+            with os.scandir(direct_dir) as entries:
+                for entry in entries:
+                    try:
+                        os.unlink(entry.path)  # only dead .part files end up left here
+                    except OSError:
+                        pass
+            try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=DIRECT_WORKERS) as pool:
+                    futures = {
+                        pool.submit(self.fetch_direct, item, download_dir, direct_dir): item
+                        for item in to_fetch
+                    }
+                    for future in concurrent.futures.as_completed(futures):
+                        if not future.result():
+                            browser_items.put(futures[future])
+            finally:
+                for _ in workers:
+                    browser_items.put(None)  # no more work is coming
+            for worker in workers:
+                worker.join()
+            for folder in (direct_dir, download_dir / STAGING_DIR):
+                try:
+                    folder.rmdir()
+                except OSError:
+                    pass  # something was left behind in it
+                
+        except Exception as e:
+            self.post(('log', f"Critical Error: {e}", 'error'))
+        finally:
+            # Checksums may still be running for the last few files. These futures
+            # resolve when on_checksum_done has finished, not when the hash is ready
+            # (waiters wake before done-callbacks run)
+            concurrent.futures.wait(pending_hashes)
+            self.save_hash_cache()
+            self.post(('download_complete', None))
+
+    def browser_worker(self, jobs: queue.Queue, download_dir: Path, n: int, options: dict, pending_hashes: list):
+        """Take items off jobs (until a None) and download them with a browser of this thread's own
+
+        The browser saves into its own staging folder; finished files are moved
+        into download_dir by claim_download.
+        """
+        dl_str = os.fspath(download_dir)
+        work_dir = download_dir / STAGING_DIR / f"w{n}"
+        driver = None
+        downloads_since_refresh = 0
+        try:
+            work_dir.mkdir(parents=True, exist_ok=True)
+            # Leftovers of an interrupted run: finished files are kept, partial ones dropped
+            self.claim_download(work_dir, download_dir)
+            with os.scandir(work_dir) as entries:
+                for entry in entries:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+
+            while not self.stop_event.is_set():
+                item = jobs.get()
+                # stop may have come while blocked in get(); leave the item PENDING
+                if item is None or self.stop_event.is_set():
+                    break
+
+                if driver is None:
+                    driver = setup_driver(work_dir, headless=options['headless'])
+                    self.drivers.append(driver)
 
                 # Start Download
-                item.status = DownloadStatus.DOWNLOADING
+                self.set_status(item, DownloadStatus.DOWNLOADING)
                 item.start_time = time.time()
-                self.gui_queue.put(('status', f"Downloading: {item.filename}"))
-                self.gui_queue.put(('update_queue', None))
-                
-                result = click_download_button(self.driver, item.url, download_dir)
-                
+                self.post(('status', f"Downloading: {item.filename}"))
+                self.post(('update_item', item))
+
+                # Refresh session logic
+                if downloads_since_refresh >= options['session_refresh']:
+                    self.post(('log', 'Refreshing browser session...', 'info'))
+                    self.drivers.remove(driver)
+                    quit_driver(driver)
+                    driver = setup_driver(work_dir, headless=options['headless'])
+                    self.drivers.append(driver)
+                    downloads_since_refresh = 0
+
+                result = click_download_button(driver, item.url, work_dir)
+
                 if result is True:
-                    item.status = DownloadStatus.COMPLETED
                     downloads_since_refresh += 1
                     
-                    downloaded = check_file_exists(download_dir, item.url)
-                    if downloaded:
-                        file_path = download_dir / downloaded
+                    downloaded = self.claim_download(work_dir, download_dir, item.url)
+                    if not downloaded:
+                        # Only a .crdownload/.part came out of the click
+                        self.set_status(item, DownloadStatus.FAILED)
+                        item.error = "Download incomplete"
+                        self.post(('log', f"Failed (incomplete): {item.filename}", 'error'))
+                    else:
+                        file_path = os.path.join(dl_str, downloaded)
                         item.size = os.path.getsize(file_path) / (1024 * 1024)
                         
-                        if self.checksum_var.get():
-                            self.gui_queue.put(('log', f'Verifying: {downloaded}', 'info'))
-                            item.checksum = self.calculate_checksum(str(file_path))
+                        if options['verify']:
+                            # Hashed on hash_pool while the browser moves on to the next
+                            # URL; the item stays DOWNLOADING until on_checksum_done
+                            self.post(('log', f'Verifying: {downloaded}', 'info'))
+                            future = self.calculate_checksum(file_path)
+                            done = concurrent.futures.Future()
+                            pending_hashes.append(done)
+                            future.add_done_callback(
+                                lambda f, item=item, done=done: self.on_checksum_done(item, f, done)
+                            )
+                            continue
                             
-                        self.gui_queue.put(('log', f"Success: {item.filename}", 'success'))
+                        self.post(('log', f"Success: {item.filename}", 'success'))
+                        self.set_status(item, DownloadStatus.COMPLETED)
                 else:
-                    item.status = DownloadStatus.FAILED
-                    self.gui_queue.put(('log', f"Failed: {item.filename}", 'error'))
+                    self.set_status(item, DownloadStatus.FAILED)
+                    self.post(('log', f"Failed: {item.filename}", 'error'))
                 
                 item.end_time = time.time()
-                self.gui_queue.put(('update_queue', None))
-                self.gui_queue.put(('update_stats', None))
-                self.gui_queue.put(('progress', int(((idx+1)/len(self.download_items))*100)))
-                
+                self.post(('update_item', item))
+                self.post(('update_stats', None))
+                self.post_progress()
+
         except Exception as e:
-            self.gui_queue.put(('log', f"Critical Error: {e}", 'error'))
+            if not self.stop_event.is_set():  # quitting the browser mid-download raises
+                self.post(('log', f"Browser worker error: {e}", 'error'))
         finally:
-            if self.driver:
-                self.driver.quit()
-            self.gui_queue.put(('download_complete', None))
+            if driver:
+                if driver in self.drivers:
+                    self.drivers.remove(driver)
+                try: driver.quit()
+                except: pass
+            try:
+                work_dir.rmdir()
+            except OSError:
+                pass  # a partial download is still in it
+
+    def claim_download(self, work_dir: Path, download_dir: Path, url: Optional[str] = None) -> Optional[str]:
+        """Move finished files out of a browser's staging folder into download_dir
+
+        Partial (.crdownload/.part/.tmp) files stay where they are. Returns the final
+        name of the file matching url (or of the first file moved), or None.
+        """
+        hint = check_file_exists(work_dir, url) if url else None
+        claimed = None
+        with os.scandir(work_dir) as entries:
+            names = [entry.name for entry in entries
+                     if entry.is_file() and not entry.name.endswith(('.crdownload', '.part', '.tmp'))]
+        for name in names:
+            # Same " (1)" suffixes the browser itself would have picked
+            target = name
+            base, ext = os.path.splitext(name)
+            copy = 1
+            with self._claim_lock:
+                while os.path.exists(os.path.join(download_dir, target)):
+                    target = f"{base} ({copy}){ext}"
+                    copy += 1
+                os.replace(os.path.join(work_dir, name), os.path.join(download_dir, target))
+            if claimed is None or name == hint:
+                claimed = target
+        return claimed
+
+    def load_hash_cache(self, download_dir):
+        """Load the checksum sidecar of download_dir unless it is the one already loaded"""
+        path = Path(download_dir) / HASH_CACHE_FILE
+        if path == self._hash_cache_path:
+            return
+        self._hash_cache_path = path
+        self._hash_cache_dirty = False
+        try:
+            entries = json.loads(path.read_text())
+            self._checksum_cache = {key: tuple(entry) for key, entry in entries.items()}
+        except (OSError, ValueError):
+            self._checksum_cache = {}
+
+    def save_hash_cache(self):
+        """Atomically rewrite the checksum sidecar if new checksums were computed"""
+        if not self._hash_cache_dirty or self._hash_cache_path is None:
+            return
+        self._hash_cache_dirty = False
+        # forget files that have since been moved or deleted
+        entries = {
+            key: entry for key, entry in list(self._checksum_cache.items()) if os.path.exists(key)
+        }
+        tmp_path = self._hash_cache_path.with_name(HASH_CACHE_FILE + '.tmp')
+        try:
+            tmp_path.write_bytes(dump_json(entries))
+            os.replace(tmp_path, self._hash_cache_path)
+        except OSError as e:
+            self.post(('log', f"Could not save checksum cache: {e}", 'warning'))
+
+    def fetch_direct(self, item: DownloadItem, download_dir: Path, staging_dir: Path) -> bool:
+        """Download item over plain HTTP if its URL serves the file (pool thread)
+
+        The file is hashed as it streams to disk, so it never has to be read back.
+        Returns False when the item has to go through the browser instead. Stop and a
+        confirmed quit set abort_event, which aborts a transfer that is streaming;
+        Pause lets it finish.
+        """
+        if self.stop_event.is_set() or not is_direct_download(item.url):
+            return False
+
+        self.set_status(item, DownloadStatus.DOWNLOADING)
+        item.start_time = time.time()
+        self.post(('status', f"Downloading: {item.filename}"))
+        self.post(('update_item', item))
+
+        direct = download_direct(item.url, download_dir, cancel=self.abort_event, staging_dir=staging_dir)
+        if direct == "EXISTS":
+            self.set_status(item, DownloadStatus.SKIPPED)
+            self.post(('log', f"Skipped (exists): {item.filename}", 'warning'))
+            self.post(('update_item', item))
+            self.post(('update_stats', None))
+            self.post_progress()
+            return True
+        if direct == "CANCELLED":
+            # Stopped mid-transfer; the partial file is gone, so it starts over next run
+            self.set_status(item, DownloadStatus.PENDING)
+            self.post(('log', f"Cancelled: {item.filename}", 'warning'))
+            self.post(('update_item', item))
+            return True
+        if not direct:
+            self.set_status(item, DownloadStatus.PENDING)
+            self.post(('update_item', item))
+            return False
+
+        downloaded, item.checksum = direct
+        self.set_status(item, DownloadStatus.COMPLETED)
+        # Hashed while streaming; cache it so a later verify never re-reads the file
+        file_path = os.path.abspath(os.path.join(download_dir, downloaded))
+        st = os.stat(file_path)
+        self.record_checksum(file_path, st, item.checksum)
+        item.size = st.st_size / (1024 * 1024)
+        item.end_time = time.time()
+        self.post(('log', f"Success: {item.filename}", 'success'))
+        self.post(('update_item', item))
+        self.post(('update_stats', None))
+        self.post_progress()
+        return True
+
+    def post_progress(self):
+        """Queue a progress-bar update derived from status_counts (any thread)"""
+        total = len(self.download_items) or 1
+        remaining = self.status_counts[DownloadStatus.PENDING] + self.status_counts[DownloadStatus.DOWNLOADING]
+        self.post(('progress', int((total - remaining) / total * 100)))
 
     def pause_downloads(self):
         self.is_downloading = False
+        self._resume_pending = False
+        self.stop_event.set()
         self.pause_btn.config(state=tk.DISABLED)
         self.log("Pausing after current download...", 'warning')
         
     def stop_downloads(self):
         self.is_downloading = False
+        self._resume_pending = False
+        self.stop_event.set()
+        self.abort_event.set()
         self.log("Stopping all operations...", 'error')
-        if self.driver:
-            try: self.driver.quit()
-            except: pass
+        self.quit_drivers()
         self.start_btn.config(state=tk.NORMAL)
         self.pause_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.DISABLED)
+
+    def quit_drivers(self):
+        for driver in list(self.drivers):
+            try: driver.quit()
+            except: pass
+
+    def hold_downloads(self):
+        """Quit dialog is up: let running items finish, but start no new ones"""
+        self._held = True
+        self.stop_event.set()
+
+    def halt_downloads(self):
+        """Quit confirmed: abort transfers and close the browsers off the GUI thread"""
+        self._held = False
+        self.stop_event.set()
+        self.abort_event.set()
+        self.halt_thread = threading.Thread(target=self.quit_drivers, daemon=True)
+        self.halt_thread.start()
+
+    def resume_downloads(self):
+        """Quit cancelled: carry on, and pick up anything the hold left PENDING"""
+        self._held = False
+        self.stop_event.clear()
+        self._resume_pending = True
+        if self._done_while_held:
+            self.on_download_complete()
         
     def open_output_folder(self):
         output_dir = self.output_var.get()
@@ -690,24 +1274,66 @@ class DownloaderGUI:
             if os.name == 'nt': os.startfile(output_dir)
             else: os.system(f'xdg-open "{output_dir}"')
             
+    def post(self, msg: tuple):
+        """Queue msg for the GUI and wake the main loop to handle it (any thread)"""
+        self.gui_queue.put(msg)
+        if not self._queue_signalled:
+            self._queue_signalled = True
+            try:
+                self.root.event_generate('<<QueueEvent>>', when='tail')
+            except (RuntimeError, tk.TclError):
+                pass  # main loop gone or busy shutting down; the watchdog drains instead
+
     def check_queue(self):
+        """Watchdog drain, in case a <<QueueEvent>> was ever missed"""
+        self.drain_queue()
+        self.root.after(QUEUE_WATCHDOG_MS, self.check_queue)
+
+    def drain_queue(self):
+        # Cleared first: anything posted from here on raises a fresh event
+        self._queue_signalled = False
+        # Drain everything first, then touch each widget at most once per batch
+        log_entries = []
+        dirty_items = {}
+        need_stats = False
+        status = None
+        progress = None
+        added = []
+        finished = False
         try:
             while True:
                 msg_type, *args = self.gui_queue.get_nowait()
                 
-                if msg_type == 'log': self.log(*args)
-                elif msg_type == 'status': self.update_status(args[0])
-                elif msg_type == 'progress': self.progress_bar['value'] = args[0]
-                elif msg_type == 'update_queue': self.update_queue_display()
-                elif msg_type == 'update_stats': self.update_statistics()
-                elif msg_type == 'scrape_result': self.process_loaded_urls(args[0])
-                elif msg_type == 'download_complete': self.on_download_complete()
+                if msg_type == 'log': log_entries.append(args)
+                elif msg_type == 'status': status = args[0]
+                elif msg_type == 'progress': progress = args[0]
+                elif msg_type == 'update_item': dirty_items[id(args[0])] = args[0]
+                elif msg_type == 'update_stats': need_stats = True
+                elif msg_type == 'add_item': added.append(args[0])
+                elif msg_type == 'download_complete': finished = True
                     
         except queue.Empty:
             pass
-        self.root.after(100, self.check_queue)
+
+        if log_entries: self.write_log(log_entries)
+        if added: self.add_items(added)
+        for item in dirty_items.values(): self.update_queue_item(item)
+        if need_stats: self.update_statistics()
+        if status is not None: self.update_status(status)
+        if progress is not None: self.progress_bar['value'] = progress
+        if finished: self.on_download_complete()
         
     def on_download_complete(self):
+        if self._held:
+            self._done_while_held = True  # resume_downloads finishes it
+            return
+        self._done_while_held = False
+        if self._resume_pending:
+            self._resume_pending = False
+            if self.status_counts[DownloadStatus.PENDING]:
+                self.log("Resuming downloads...", 'info')
+                self._start_when_idle()
+                return
         self.is_downloading = False
         self.start_btn.config(state=tk.NORMAL)
         self.pause_btn.config(state=tk.DISABLED)
@@ -715,58 +1341,186 @@ class DownloaderGUI:
         self.progress_bar['value'] = 100
         self.update_status("Batch operation complete")
         self.log("All operations finished", 'success')
+
+    def _start_when_idle(self):
+        """Start the next batch once the worker thread has exited; polled, never joined"""
+        if self.download_thread is not None and self.download_thread.is_alive():
+            self.root.after(50, self._start_when_idle)
+        elif self.stop_event.is_set():
+            self.on_download_complete()  # paused, stopped or held while waiting
+        else:
+            self.start_downloads()
         
     def load_settings(self):
         try:
-            if os.path.exists('downloader_settings.json'):
-                with open('downloader_settings.json', 'r') as f:
-                    settings = json.load(f)
-                    self.output_var.set(settings.get('output_dir', ''))
-                    self.headless_var.set(settings.get('headless', True))
-                    self.session_refresh_var.set(settings.get('session_refresh', 10))
+            if SETTINGS_FILE.exists():
+                payload = SETTINGS_FILE.read_bytes()
+                settings = json.loads(payload)
+                self.output_var.set(settings.get('output_dir', ''))
+                self.headless_var.set(settings.get('headless', True))
+                self.session_refresh_var.set(settings.get('session_refresh', 10))
+                if self.output_var.get():
+                    self.load_hash_cache(self.output_var.get())
+                self._last_settings_blob = payload
         except: pass
         
+    def schedule_save_settings(self, *args):
+        """Variable trace: a burst of edits (e.g. typing a path) ends in one save"""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(SETTINGS_DEBOUNCE_MS, self.save_settings)
+
     def save_settings(self):
+        # Called directly (on close) it also stands in for the pending debounced save
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        # Tk variables can only be read here; the disk write happens in settings_writer
         try:
-            settings = {
+            self._settings_queue.put({
                 'output_dir': self.output_var.get(),
                 'headless': self.headless_var.get(),
                 'session_refresh': self.session_refresh_var.get()
-            }
-            with open('downloader_settings.json', 'w') as f:
-                json.dump(settings, f, indent=2)
-        except: pass
+            })
+        except (tk.TclError, ValueError) as e:
+            print(f"Could not save settings: {e}", file=sys.stderr)
+
+    def settings_writer(self):
+        """Background thread: write the newest queued settings, skipping older ones"""
+        while True:
+            settings = self._settings_queue.get()
+            done = settings is None
+            while True:
+                try:
+                    newer = self._settings_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    done = True
+                else:
+                    settings = newer
+            if settings is not None:
+                self.write_settings(settings)
+            if done:
+                return
+
+    def stop_settings_writer(self, timeout=1.0):
+        """Let the writer flush whatever is queued, then stop it"""
+        self._settings_queue.put(None)
+        self.settings_thread.join(timeout)
+
+    def write_settings(self, settings):
+        try:
+            payload = dump_json(settings)
+            if payload == self._last_settings_blob:
+                return  # nothing changed since the last load/save
+            if self._settings_fd is None:
+                self._settings_fd = os.open(
+                    SETTINGS_FILE, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644
+                )
+            fd = self._settings_fd
+            if hasattr(os, 'pwrite'):
+                os.pwrite(fd, payload, 0)
+            else:  # Windows
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, payload)
+            os.ftruncate(fd, len(payload))
+            self._settings_dirty = True
+            self._last_settings_blob = payload
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not save settings: {e}", file=sys.stderr)
+
+    def sync_settings(self):
+        """At shutdown: close the live settings file and swap in a fsynced copy"""
+        if self._settings_fd is not None:
+            try:
+                os.close(self._settings_fd)
+            except OSError:
+                pass
+            self._settings_fd = None
+        if not self._settings_dirty:
+            return
+        # Write beside the real file and swap it in, so a crash mid-write
+        # never leaves a truncated settings file behind
+        tmp_file = SETTINGS_FILE.with_name(SETTINGS_FILE.name + '.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(self._last_settings_blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, SETTINGS_FILE)
+            self._settings_dirty = False
+        except OSError as e:
+            print(f"Could not save settings: {e}", file=sys.stderr)
 
 def main():
     root = tk.Tk()
 
-    
-    # --- ADD THIS BLOCK ---
-    try:
-        # Use a high-quality png (e.g., 64x64 or 128x128)
-        icon_image = tk.PhotoImage(file='app.png')
-        root.iconphoto(True, icon_image)
-    except Exception as e:
-        print(f"Icon image not found: {e}")
-    # ----------------------
-
-    # Configure global font...
-    default_font = Font(family="Segoe UI", size=10)
-    root.option_add("*Font", default_font)
-    
+    # The icon isn't needed for the first frame, so install it once idle
+    def _install_icon():
+        try:
+            # Use a high-quality png (e.g., 64x64 or 128x128)
+            try:
+                from icon_data import ICON_B64
+                icon_image = tk.PhotoImage(data=ICON_B64)
+            except ImportError:
+                icon_image = tk.PhotoImage(file='app.png')
+            root._icon_ref = icon_image  # keep it alive past this call
+            root.iconphoto(True, icon_image)
+        except Exception as e:
+            print(f"Icon image not found: {e}")
+
     app = DownloaderGUI(root)
+    root.after_idle(_install_icon)
     
+    def _confirm_quit():
+        """Ask before quitting mid-batch; no new item starts while the user decides"""
+        dlg = tk.Toplevel(root, bg=app.colors['bg_dark'], padx=20, pady=15)
+        dlg.title("Quit")
+        dlg.resizable(False, False)
+        dlg.transient(root)
+        result = tk.IntVar(root, 0)
+
+        def close(value):
+            result.set(value)
+            dlg.destroy()
+
+        ttk.Label(dlg, text="Downloads in progress. Quit anyway?").pack(pady=(0, 15))
+        buttons = ttk.Frame(dlg)
+        buttons.pack(anchor=tk.E)
+        ttk.Button(buttons, text="OK", width=8, command=lambda: close(1), style='Accent.TButton').pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(buttons, text="Cancel", width=8, command=lambda: close(0)).pack(side=tk.LEFT)
+        dlg.bind('<Return>', lambda event: close(1))
+        dlg.bind('<Escape>', lambda event: close(0))
+        dlg.protocol("WM_DELETE_WINDOW", lambda: close(0))
+
+        app.hold_downloads()
+        dlg.grab_set()
+        root.wait_window(dlg)
+        return result.get() == 1
+
     def on_closing():
         app.save_settings()
         if app.is_downloading:
-            if messagebox.askokcancel("Quit", "Downloads in progress. Quit anyway?"):
-                app.stop_downloads()
+            if _confirm_quit():
+                app.halt_downloads()
                 root.destroy()
+            else:
+                app.resume_downloads()
         else:
             root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
+    if app.halt_thread is not None:
+        app.halt_thread.join(10)  # let the browsers finish closing
+    if app.download_thread is not None:
+        app.download_thread.join(5)  # it saves the checksum sidecar on its way out
+    app.save_hash_cache()
+    app.stop_settings_writer()
+    app.sync_settings()
+    app.hash_pool.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file